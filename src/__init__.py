@@ -2,6 +2,28 @@
 Source package for German Translator App.
 """
 
-from src.translator import translate_to_english, translate_to_spanish
-from src.gender_detector import analyze_text, colorize_text_html, get_color_legend
+import importlib
 
+# Public names and the module that defines them. They are imported on first
+# access, so `import src` does not load spaCy or deep-translator up front.
+_EXPORTS = {
+    "translate_to_english": "src.translator",
+    "translate_to_spanish": "src.translator",
+    "AnalyzedTokens": "src.gender_detector",
+    "analyze_text": "src.gender_detector",
+    "analyze_texts": "src.gender_detector",
+    "colorize_text_html": "src.gender_detector",
+    "get_color_legend": "src.gender_detector",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,158 @@
+"""
+Static markup for the Streamlit UI: the color palette and the page CSS.
+"""
+
+import re
+
+# Color Palette
+COLORS = {
+    "sage_light": "#BFC3BA",      # Light sage - text, accents
+    "gray_medium": "#A9ACA9",     # Medium gray - secondary text
+    "purple_muted": "#60495A",    # Muted purple - borders, accents
+    "purple_dark": "#2F2235",     # Dark purple - cards, sidebar
+    "purple_darker": "#1A1520",   # Darkest purple - main background
+    "black": "#0D0B0E",           # Near black - outer frame
+}
+
+
+# Page CSS with the palette substituted once, at import time
+_CSS_SOURCE = f"""
+<style>
+/* Main app background */
+.stApp {{
+    background-color: {COLORS["black"]};
+}}
+
+/* Main content padding */
+.main .block-container {{
+    padding: 20px 30px;
+    max-width: 1400px;
+}}
+
+/* Sidebar styling */
+[data-testid="stSidebar"] {{
+    background-color: {COLORS["purple_darker"]};
+    border-right: 2px solid {COLORS["purple_muted"]};
+}}
+
+[data-testid="stSidebar"] [data-testid="stMarkdownContainer"] p {{
+    color: {COLORS["sage_light"]};
+}}
+
+/* Text area styling */
+.stTextArea textarea {{
+    font-size: 16px;
+    background-color: {COLORS["purple_dark"]} !important;
+    color: {COLORS["sage_light"]} !important;
+    border: 2px solid {COLORS["purple_muted"]};
+    border-radius: 8px;
+    -webkit-text-fill-color: {COLORS["sage_light"]} !important;
+    opacity: 1 !important;
+}}
+
+.stTextArea textarea:focus {{
+    border-color: {COLORS["sage_light"]};
+    box-shadow: none;
+}}
+
+.stTextArea textarea::placeholder {{
+    color: {COLORS["gray_medium"]} !important;
+    -webkit-text-fill-color: {COLORS["gray_medium"]} !important;
+}}
+
+/* Disabled text area - ensure text is visible */
+.stTextArea textarea:disabled {{
+    background-color: {COLORS["purple_dark"]} !important;
+    color: {COLORS["sage_light"]} !important;
+    -webkit-text-fill-color: {COLORS["sage_light"]} !important;
+    opacity: 1 !important;
+}}
+
+/* Text area labels */
+.stTextArea label {{
+    color: {COLORS["sage_light"]} !important;
+    font-size: 14px !important;
+    font-weight: 600 !important;
+}}
+
+/* Fix label color for all text inputs */
+.stTextArea label p {{
+    color: {COLORS["sage_light"]} !important;
+}}
+
+/* Sidebar buttons */
+[data-testid="stSidebar"] .stButton button {{
+    background-color: {COLORS["purple_darker"]};
+    color: {COLORS["sage_light"]};
+    border: 1px solid {COLORS["purple_muted"]};
+    font-size: 12px;
+    padding: 8px 12px;
+    text-align: left;
+    width: 100%;
+    margin-bottom: 5px;
+    border-radius: 6px;
+}}
+
+[data-testid="stSidebar"] .stButton button:hover {{
+    background-color: {COLORS["purple_muted"]};
+    border-color: {COLORS["sage_light"]};
+}}
+
+/* Hide default Streamlit elements */
+#MainMenu {{visibility: hidden;}}
+footer {{visibility: hidden;}}
+header {{visibility: hidden;}}
+
+/* Card styling */
+.card {{
+    background: {COLORS["purple_dark"]};
+    border: 2px solid {COLORS["purple_muted"]};
+    border-radius: 8px;
+    padding: 20px;
+    height: 100%;
+}}
+
+.card-title {{
+    color: {COLORS["sage_light"]};
+    font-size: 14px;
+    font-weight: 600;
+    margin-bottom: 15px;
+    letter-spacing: 0.5px;
+}}
+
+.card-content {{
+    color: {COLORS["sage_light"]};
+    font-size: 16px;
+    line-height: 1.9;
+    font-family: 'Georgia', 'Times New Roman', serif;
+}}
+
+/* Dialog styling - speaker names */
+.card-content strong {{
+    color: {COLORS["sage_light"]};
+    font-weight: 700;
+}}
+
+/* Dialog paragraphs */
+.card-content div {{
+    margin-bottom: 10px;
+}}
+
+/* Labels above the cards */
+.stApp .card-label {{
+    color: {COLORS["sage_light"]};
+    font-size: 14px;
+    font-weight: 600;
+    margin-bottom: 5px;
+}}
+
+/* Placeholder text in empty cards */
+.stApp .card-placeholder {{
+    color: {COLORS["gray_medium"]};
+    font-size: 14px;
+}}
+</style>
+"""
+
+# Sent to the browser on every run, so comments and indentation are stripped
+CSS_BLOB = re.sub(r"\s+", " ", re.sub(r"/\*.*?\*/", "", _CSS_SOURCE, flags=re.S)).strip()
@@ -3,11 +3,27 @@ Gender detection module for German text.
 Uses spaCy to analyze articles and nouns, detecting grammatical gender.
 """
 
+import html
+import re
+import threading
 import spacy
-from typing import List, Dict, Tuple
+from spacy.symbols import NOUN, PUNCT
+from spacy.tokens import Doc
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict
 
-# Load German language model
-nlp = spacy.load("de_core_news_sm")
+# German language model, loaded on first use (see _get_nlp); the lock keeps
+# concurrent Streamlit sessions from loading it more than once
+_nlp = None
+_NLP_LOCK = threading.Lock()
+
+# Per-Doc cache of the gender analysis (see _analyze_doc)
+if not Doc.has_extension("gender_info"):
+    Doc.set_extension("gender_info", default=None)
+
+# Speaker name at the start of a dialog line (e.g., "Michael:", "Hr. Scheibe:")
+_SPEAKER_RE = re.compile(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*')
 
 # Color mapping for genders
 GENDER_COLORS = {
@@ -59,6 +75,77 @@ PERSONAL_PRONOUNS = {
     "ihm": "masculine",
 }
 
+# CSS class for each gender, used instead of inline styles on every span
+_CLASS_BY_GENDER = {
+    "masculine": "g-m",
+    "feminine": "g-f",
+    "neuter": "g-n",
+    "plural": "g-p",
+    "default": "g-d",
+}
+
+# <style> block for the gender classes; included once per colorize_text_html output
+GENDER_STYLE = "<style>" + "".join(
+    f".{css_class}{{color:{GENDER_COLORS[gender]};font-weight:700}}"
+    for gender, css_class in _CLASS_BY_GENDER.items()
+) + "</style>"
+
+# Opening span tag for each gender, built once
+_OPEN_SPAN = {gender: f'<span class="{css_class}">' for gender, css_class in _CLASS_BY_GENDER.items()}
+_CLOSE_SPAN = "</span>"
+
+# Punctuation that attaches to the preceding word when rendering
+NO_SPACE_BEFORE = frozenset({",", ".", "!", "?", ";", ":", "'", '"'})
+
+# Single lookup table: lowercased word -> (kind, gender).
+# Articles get their gender from morphology (gender None); pronouns have a fixed one.
+# Articles are added last so words like "ihr" resolve to the possessive article.
+WORD_TO_KIND = {word: ("pronoun", gender) for word, gender in PERSONAL_PRONOUNS.items()}
+for _articles in (DEFINITE_ARTICLES, INDEFINITE_ARTICLES, NEGATIVE_ARTICLES, POSSESSIVE_ARTICLES):
+    WORD_TO_KIND.update((word, ("article", None)) for word in _articles)
+del _articles
+
+
+@dataclass(frozen=True)
+class AnalyzedTokens:
+    """
+    Word-by-word gender information for a text, stored as parallel lists
+    with one entry per token.
+    
+    Attributes:
+        words: Token texts
+        genders: 'masculine', 'feminine', 'neuter', 'plural', or 'default'
+        colors: Hex color for each gender
+        is_article: True for articles and personal pronouns
+        is_noun: True for nouns
+    """
+    words: List[str] = field(default_factory=list)
+    genders: List[str] = field(default_factory=list)
+    colors: List[str] = field(default_factory=list)
+    is_article: List[bool] = field(default_factory=list)
+    is_noun: List[bool] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def _get_nlp():
+    """
+    Return the German spaCy pipeline, loading it on first call.
+    
+    Only token text, POS and morphology are used, so the parser, NER and
+    lemmatizer are skipped (tagger/morphologizer/attribute_ruler stay enabled).
+    
+    Returns:
+        The loaded spaCy Language object
+    """
+    global _nlp
+    if _nlp is None:
+        with _NLP_LOCK:
+            if _nlp is None:
+                _nlp = spacy.load("de_core_news_sm", disable=["parser", "ner", "lemmatizer"])
+    return _nlp
+
 
 def get_gender_from_article(token) -> str:
     """
@@ -70,9 +157,20 @@ def get_gender_from_article(token) -> str:
     Returns:
         Gender string: 'masculine', 'feminine', 'neuter', 'plural', or 'default'
     """
-    text_lower = token.text.lower()
-    morph = token.morph
+    return _article_gender(token.text.lower(), token.morph)
+
+
+def _article_gender(text_lower: str, morph) -> str:
+    """
+    Determine the gender of an article from its lowercased text and morphology.
     
+    Args:
+        text_lower: Lowercased article text
+        morph: spaCy MorphAnalysis of the article token
+        
+    Returns:
+        Gender string: 'masculine', 'feminine', 'neuter', 'plural', or 'default'
+    """
     # Get morphological features
     gender = morph.get("Gender")
     number = morph.get("Number")
@@ -116,104 +214,142 @@ def get_gender_from_article(token) -> str:
     return "default"
 
 
-def analyze_text(german_text: str) -> List[Dict]:
+@lru_cache(maxsize=128)
+def analyze_text(german_text: str) -> AnalyzedTokens:
     """
     Analyze German text and return word-by-word gender information.
+    Results are cached per text and shared between callers, so treat them
+    as read-only.
     
     Args:
         german_text: The German text to analyze
         
     Returns:
-        List of dictionaries with word info:
-        [{'word': str, 'gender': str, 'color': str, 'is_article': bool}, ...]
+        AnalyzedTokens with one entry per token
     """
     if not german_text or not german_text.strip():
-        return []
+        return AnalyzedTokens()
+    
+    return _analyze_doc(_get_nlp()(german_text))
+
+
+def analyze_texts(german_texts: List[str], n_process: int = 2) -> List[AnalyzedTokens]:
+    """
+    Analyze several German texts in one batch (e.g. a corpus of dialogs).
+    Use analyze_text for a single input.
     
-    doc = nlp(german_text)
-    result = []
+    With n_process > 1 spaCy runs the pipeline in worker processes, each
+    holding its own copy of the model, so memory grows with the number of
+    workers; it only pays off for large batches.
+    
+    Args:
+        german_texts: The German texts to analyze
+        n_process: Number of processes for the spaCy pipeline
+        
+    Returns:
+        One AnalyzedTokens per input text
+    """
+    results = [AnalyzedTokens() for _ in german_texts]
+    indices = [i for i, text in enumerate(german_texts) if text and text.strip()]
+    docs = _get_nlp().pipe(
+        (german_texts[i] for i in indices), batch_size=64, n_process=n_process
+    )
+    
+    for i, doc in zip(indices, docs):
+        results[i] = _analyze_doc(doc)
+    
+    return results
+
+
+def _analyze_doc(doc) -> AnalyzedTokens:
+    """
+    Classify the tokens of an already-processed spaCy Doc by gender.
+    The result is stored on the Doc as doc._.gender_info, so analyzing the
+    same Doc again returns it without rerunning the loop.
+    
+    Args:
+        doc: spaCy Doc object
+        
+    Returns:
+        AnalyzedTokens with one entry per token
+    """
+    if doc._.gender_info is not None:
+        return doc._.gender_info
+    
+    words = []
+    genders = []
+    token_colors = []
+    is_article = []
+    is_noun = []
+    
+    # Bind module-level lookups to locals; this loop runs once per token
+    kind_of = WORD_TO_KIND.get
+    article_gender = _article_gender
+    colors = GENDER_COLORS
+    default_color = colors["default"]
     
     # Track the gender of articles to apply to following nouns
     current_gender = None
     
     for token in doc:
-        word_info = {
-            "word": token.text,
-            "gender": "default",
-            "color": GENDER_COLORS["default"],
-            "is_article": False,
-            "is_noun": False,
-        }
+        text = token.text
+        pos = token.pos
+        gender = "default"
+        article = False
+        noun = False
         
-        text_lower = token.text.lower()
+        text_lower = text.lower()
         
-        # Check if it's a definite or indefinite article
-        if text_lower in DEFINITE_ARTICLES or text_lower in INDEFINITE_ARTICLES:
-            gender = get_gender_from_article(token)
-            word_info["gender"] = gender
-            word_info["color"] = GENDER_COLORS.get(gender, GENDER_COLORS["default"])
-            word_info["is_article"] = True
-            current_gender = gender
+        kind_info = kind_of(text_lower)
         
-        # Check if it's a negative article (kein)
-        elif text_lower in NEGATIVE_ARTICLES:
-            gender = get_gender_from_article(token)
-            word_info["gender"] = gender
-            word_info["color"] = GENDER_COLORS.get(gender, GENDER_COLORS["default"])
-            word_info["is_article"] = True
-            current_gender = gender
-        
-        # Check if it's a possessive article (mein, dein, sein, etc.)
-        elif text_lower in POSSESSIVE_ARTICLES:
-            gender = get_gender_from_article(token)
-            word_info["gender"] = gender
-            word_info["color"] = GENDER_COLORS.get(gender, GENDER_COLORS["default"])
-            word_info["is_article"] = True
-            current_gender = gender
-        
-        # Check if it's a personal pronoun
-        elif text_lower in PERSONAL_PRONOUNS:
-            gender = PERSONAL_PRONOUNS[text_lower]
-            word_info["gender"] = gender
-            word_info["color"] = GENDER_COLORS.get(gender, GENDER_COLORS["default"])
-            word_info["is_article"] = True  # Treat as article for coloring
+        # Check if it's an article (definite, indefinite, kein, possessive)
+        # or a personal pronoun
+        if kind_info is not None:
+            kind, gender = kind_info
+            if kind == "article":
+                gender = article_gender(text_lower, token.morph)
+                current_gender = gender
+            article = True  # Pronouns are treated as articles for coloring
         
         # Check if it's a noun (apply the article's gender)
-        elif token.pos_ == "NOUN":
-            word_info["is_noun"] = True
+        elif pos == NOUN:
+            noun = True
             if current_gender:
-                word_info["gender"] = current_gender
-                word_info["color"] = GENDER_COLORS.get(current_gender, GENDER_COLORS["default"])
+                gender = current_gender
             else:
                 # Try to get gender from noun's morphology
-                morph_gender = token.morph.get("Gender")
-                morph_number = token.morph.get("Number")
+                morph = token.morph
+                morph_gender = morph.get("Gender")
+                morph_number = morph.get("Number")
                 
                 if "Plur" in morph_number:
-                    word_info["gender"] = "plural"
-                    word_info["color"] = GENDER_COLORS["plural"]
+                    gender = "plural"
                 elif "Masc" in morph_gender:
-                    word_info["gender"] = "masculine"
-                    word_info["color"] = GENDER_COLORS["masculine"]
+                    gender = "masculine"
                 elif "Fem" in morph_gender:
-                    word_info["gender"] = "feminine"
-                    word_info["color"] = GENDER_COLORS["feminine"]
+                    gender = "feminine"
                 elif "Neut" in morph_gender:
-                    word_info["gender"] = "neuter"
-                    word_info["color"] = GENDER_COLORS["neuter"]
+                    gender = "neuter"
         
         # Reset gender tracking after noun or punctuation
-        if token.pos_ in {"NOUN", "PUNCT"} or token.text in {",", ".", "!", "?", ";", ":"}:
+        # (the German model tags , . ! ? ; : as PUNCT)
+        if pos == NOUN or pos == PUNCT:
             current_gender = None
         
-        result.append(word_info)
+        words.append(text)
+        genders.append(gender)
+        token_colors.append(colors.get(gender, default_color))
+        is_article.append(article)
+        is_noun.append(noun)
     
-    return result
+    doc._.gender_info = AnalyzedTokens(words, genders, token_colors, is_article, is_noun)
+    return doc._.gender_info
 
 
 def colorize_line(line: str) -> str:
     """
     Colorize a single line of German text.
+    The spans use gender CSS classes; include GENDER_STYLE once in the page.
     
     Args:
         line: A single line of German text
@@ -224,26 +360,57 @@ def colorize_line(line: str) -> str:
     if not line or not line.strip():
         return ""
     
-    analyzed = analyze_text(line)
+    if not _needs_analysis(line):
+        return html.escape(line.strip(), quote=False)
+    
+    return _render_analyzed(analyze_text(line))
+
+
+def _needs_analysis(text: str) -> bool:
+    """
+    Check whether text can contain articles worth running spaCy on.
+    Lines without letters (numbers, punctuation) or shorter than two
+    characters are rendered as plain text.
+    
+    Args:
+        text: A line of German text
+        
+    Returns:
+        True if the text should go through the spaCy pipeline
+    """
+    return len(text.strip()) >= 2 and any(c.isalpha() for c in text)
+
+
+def _render_analyzed(analyzed: AnalyzedTokens) -> str:
+    """
+    Render analyzed words as HTML, coloring the articles.
+    Words are HTML-escaped.
+    
+    Args:
+        analyzed: Analysis as returned by analyze_text
+        
+    Returns:
+        HTML string with colored spans
+    """
+    words = analyzed.words
+    
+    # Look-ahead word for each position (None after the last one)
+    next_words = words[1:]
+    next_words.append(None)
     html_parts = []
     
-    for i, word_info in enumerate(analyzed):
-        word = word_info["word"]
-        color = word_info["color"]
+    for word, next_word, is_article, gender in zip(words, next_words, analyzed.is_article, analyzed.genders):
+        word = html.escape(word, quote=False)
         
         # Only color articles, not nouns
-        if word_info["is_article"]:
-            html_parts.append(
-                f'<span style="color: {color}; font-weight: 700;">{word}</span>'
-            )
+        if is_article:
+            html_parts.append(_OPEN_SPAN[gender] + word + _CLOSE_SPAN)
         else:
             html_parts.append(word)
         
         # Add space after word (except before punctuation)
-        if i < len(analyzed) - 1:
-            next_word = analyzed[i + 1]["word"]
-            if next_word not in {",", ".", "!", "?", ";", ":", "'", '"'}:
-                html_parts.append(" ")
+        if next_word is not None and next_word not in NO_SPACE_BEFORE:
+            html_parts.append(" ")
     
     return "".join(html_parts)
 
@@ -265,37 +432,62 @@ def colorize_text_html(german_text: str, speaker_color_map: Dict[str, str] = Non
     
     # Split by line breaks to preserve dialog structure
     lines = german_text.split('\n')
-    html_lines = []
     
-    import re
+    # First pass: separate speaker names from content and collect the
+    # contents that need analysis, so they go through spaCy in one batch.
+    # Contents that don't need it are escaped right away.
+    entries = []
+    contents = []
     
     for line in lines:
         if not line.strip():
-            html_lines.append('<br>')
+            entries.append(None)
             continue
         
-        # Check if line starts with a speaker name (e.g., "Michael:", "Hr. Scheibe:")
-        # Pattern: text followed by colon at the start
-        speaker_match = re.match(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*', line)
+        # Check if line starts with a speaker name; lines without a colon
+        # can't, so skip the regex for them
+        speaker_match = _SPEAKER_RE.match(line) if ':' in line else None
         
         if speaker_match:
             speaker = speaker_match.group(1).strip()
-            rest_of_line = line[speaker_match.end():]
-            # Style the speaker name in bold with color
-            colorized_rest = colorize_line(rest_of_line)
-            
+            content = line[speaker_match.end():]
+        else:
+            speaker = None
+            content = line
+        
+        if _needs_analysis(content):
+            contents.append(content)
+            plain = None
+        else:
+            plain = html.escape(content.strip(), quote=False)
+        entries.append((speaker, plain))
+    
+    # Skip loading the model when no line needs analysis
+    docs = iter(_get_nlp().pipe(contents, batch_size=32)) if contents else iter(())
+    html_lines = []
+    
+    # Second pass: render each line, from its analyzed Doc if it has one
+    for entry in entries:
+        if entry is None:
+            html_lines.append('<br>')
+            continue
+        
+        speaker, plain = entry
+        colorized = _render_analyzed(_analyze_doc(next(docs))) if plain is None else plain
+        
+        if speaker:
             # Get speaker color from map or use default
             speaker_color = speaker_color_map.get(speaker, "#BFC3BA") if speaker_color_map else "#BFC3BA"
             
+            # Style the speaker name in bold with color
             html_lines.append(
-                f'<div style="margin-bottom: 12px;"><strong style="color: {speaker_color};">{speaker}:</strong> {colorized_rest}</div>'
+                f'<div style="margin-bottom: 12px;"><strong style="color: {speaker_color};">{speaker}:</strong> {colorized}</div>'
             )
         else:
             # Regular line without speaker
-            colorized = colorize_line(line)
             html_lines.append(f'<div style="margin-bottom: 12px;">{colorized}</div>')
     
-    return "".join(html_lines)
+    return GENDER_STYLE + "".join(html_lines)
 
 
 def get_color_legend() -> Dict[str, str]:
@@ -5,7 +5,55 @@ Preserves character names in dialogs without translating them.
 """
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import deep_translator.google
+import requests
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import NotValidLength, TranslationNotFound
+from requests.adapters import HTTPAdapter
+
+# Speaker name at the start of a dialog line (e.g., "Michael:", "Hr. Schmidt:")
+_SPEAKER_RE = re.compile(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*')
+
+# Start of the message returned instead of a translation when one fails
+ERROR_PREFIX = "Translation error: "
+
+# deep-translator only accepts texts shorter than this
+MAX_REQUEST_CHARS = 5000
+
+# Concurrent requests when lines have to be translated one by one
+MAX_WORKERS = 8
+
+# Seconds to wait for Google Translate before giving up on a request
+REQUEST_TIMEOUT = 10
+
+
+class _TimeoutSession(requests.Session):
+    """Session that applies REQUEST_TIMEOUT to requests made without one."""
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+# Keep-alive session shared by all translation requests
+_SESSION = _TimeoutSession()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS))
+
+# GoogleTranslator calls requests.get() directly, opening a new connection
+# for every request; send those calls through the shared session instead
+deep_translator.google.requests = _SESSION
+
+# GoogleTranslator keeps per-request state on the instance, so translators
+# are built once per thread and target language (see _get_translator)
+_local = threading.local()
+
+# Worker threads for translating lines one by one; reused so that their
+# translators are too
+_POOL = ThreadPoolExecutor(max_workers=MAX_WORKERS)
 
 
 def extract_dialog_parts(text: str) -> list:
@@ -26,8 +74,9 @@ def extract_dialog_parts(text: str) -> list:
             parts.append((None, '', True))
             continue
         
-        # Check if line starts with a speaker name (e.g., "Michael:", "Hr. Schmidt:")
-        speaker_match = re.match(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*', line)
+        # Check if line starts with a speaker name; lines without a colon
+        # can't, so skip the regex for them
+        speaker_match = _SPEAKER_RE.match(line) if ':' in line else None
         
         if speaker_match:
             speaker = speaker_match.group(1).strip()
@@ -39,6 +88,102 @@ def extract_dialog_parts(text: str) -> list:
     return parts
 
 
+def _chunk_lines(lines: list) -> list:
+    """
+    Group lines so that each group, joined by newlines, fits in one request.
+    
+    Args:
+        lines: The lines to group
+        
+    Returns:
+        List of line lists, in the original order
+    """
+    chunks = []
+    current = []
+    size = 0
+    
+    for line in lines:
+        added = len(line) + 1 if current else len(line)
+        if current and size + added >= MAX_REQUEST_CHARS:
+            chunks.append(current)
+            current = []
+            added = len(line)
+            size = 0
+        current.append(line)
+        size += added
+    
+    if current:
+        chunks.append(current)
+    
+    return chunks
+
+
+def _get_translator(target_lang: str) -> GoogleTranslator:
+    """
+    Return the calling thread's translator for a target language.
+    
+    Args:
+        target_lang: Target language code ('en' or 'es')
+        
+    Returns:
+        GoogleTranslator from German to the target language
+    """
+    translators = getattr(_local, "translators", None)
+    if translators is None:
+        translators = _local.translators = {}
+    
+    translator = translators.get(target_lang)
+    if translator is None:
+        translator = translators[target_lang] = GoogleTranslator(source='de', target=target_lang)
+    
+    return translator
+
+
+def _translate_line(line: str, target_lang: str) -> str:
+    """
+    Translate a single line with the calling thread's translator.
+    
+    Args:
+        line: The German line to translate
+        target_lang: Target language code ('en' or 'es')
+        
+    Returns:
+        Translated line
+    """
+    return _get_translator(target_lang).translate(line)
+
+
+def translate_lines(lines: list, target_lang: str) -> list:
+    """
+    Translate several lines using as few requests as possible.
+    Lines are sent newline-joined; if a response does not come back with the
+    same number of lines, that chunk is translated line by line instead,
+    with the requests running concurrently.
+    
+    Args:
+        lines: Non-empty German lines to translate
+        target_lang: Target language code ('en' or 'es')
+        
+    Returns:
+        List of translated lines, one per input line
+    """
+    translator = _get_translator(target_lang)
+    translated = []
+    
+    for chunk in _chunk_lines(lines):
+        try:
+            result = [line.strip() for line in translator.translate('\n'.join(chunk)).split('\n')]
+        except (NotValidLength, TranslationNotFound):
+            result = None
+        
+        if result is None or len(result) != len(chunk):
+            result = list(_POOL.map(_translate_line, chunk, repeat(target_lang)))
+        
+        translated.extend(result)
+    
+    return translated
+
+
 def translate_preserving_names(german_text: str, target_lang: str) -> str:
     """
     Translate German text while preserving character names.
@@ -54,29 +199,47 @@ def translate_preserving_names(german_text: str, target_lang: str) -> str:
         return ""
     
     try:
-        translator = GoogleTranslator(source='de', target=target_lang)
-        parts = extract_dialog_parts(german_text)
-        translated_lines = []
+        return _cached_translate(german_text, target_lang)
+    except Exception as e:
+        return f"{ERROR_PREFIX}{str(e)}"
+
+
+@lru_cache(maxsize=512)
+def _cached_translate(german_text: str, target_lang: str) -> str:
+    """
+    Translate German text while preserving character names, memoized per
+    (text, language). Errors are raised, not returned, so they are never cached.
+    
+    Args:
+        german_text: The German text to translate
+        target_lang: Target language code ('en' or 'es')
         
-        for speaker, content, is_empty in parts:
-            if is_empty:
-                translated_lines.append('')
-                continue
-            
-            if speaker:
-                # Translate only the dialog content, keep speaker name
-                if content.strip():
-                    translated_content = translator.translate(content)
-                    translated_lines.append(f"{speaker}: {translated_content}")
-                else:
-                    translated_lines.append(f"{speaker}:")
-            else:
-                # No speaker, translate the whole line
-                translated_lines.append(translator.translate(content))
+    Returns:
+        Translation with original character names preserved
+    """
+    parts = extract_dialog_parts(german_text)
+    
+    # Translate only the dialog contents (not speaker names), all together
+    contents = [content for speaker, content, is_empty in parts if not is_empty and content.strip()]
+    translations = iter(translate_lines(contents, target_lang))
+    translated_lines = []
+    
+    for speaker, content, is_empty in parts:
+        if is_empty:
+            translated_lines.append('')
+            continue
         
-        return '\n'.join(translated_lines)
-    except Exception as e:
-        return f"Translation error: {str(e)}"
+        if speaker:
+            # Keep speaker name, use the translated dialog content
+            if content.strip():
+                translated_lines.append(f"{speaker}: {next(translations)}")
+            else:
+                translated_lines.append(f"{speaker}:")
+        else:
+            # No speaker, the whole line was translated
+            translated_lines.append(next(translations))
+    
+    return '\n'.join(translated_lines)
 
 
 def translate_to_english(german_text: str) -> str:
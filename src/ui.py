@@ -3,20 +3,20 @@ Streamlit UI for German Translator with Gender-Colored Articles.
 Grid layout with sidebar for Color Legend and Examples.
 """
 
+import gc
+import html
+import importlib
+import re
+import sys
+import threading
 import streamlit as st
-from src.translator import translate_to_english, translate_to_spanish
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from src._ui_static import COLORS, CSS_BLOB
 from src.gender_detector import colorize_text_html, get_color_legend, GENDER_COLORS
 
-# Color Palette
-COLORS = {
-    "sage_light": "#BFC3BA",      # Light sage - text, accents
-    "gray_medium": "#A9ACA9",     # Medium gray - secondary text
-    "purple_muted": "#60495A",    # Muted purple - borders, accents
-    "purple_dark": "#2F2235",     # Dark purple - cards, sidebar
-    "purple_darker": "#1A1520",   # Darkest purple - main background
-    "black": "#0D0B0E",           # Near black - outer frame
-}
-
+# Speaker name at the start of a dialog line (e.g., "Michael:", "Hr. Schmidt:")
+_SPEAKER_RE = re.compile(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*')
 
 # Speaker color palette for dialog names
 SPEAKER_COLORS = [
@@ -30,34 +30,151 @@ SPEAKER_COLORS = [
     "#F87171",  # Red
 ]
 
+# Card wrappers; colors and fonts come from the classes in the page CSS
+_CARD_OPEN = '<div class="card" style="height: 400px; overflow-y: auto;"><div class="card-content">'
+_PREVIEW_CARD_OPEN = '<div class="card" style="height: 250px; overflow-y: auto;"><div class="card-content">'
+_CARD_CLOSE = '</div></div>'
+
+# Column labels, emitted together with each card
+_PREVIEW_LABEL = '<p class="card-label" style="margin-top: 10px;">📝 Input Preview</p>'
+_GERMAN_LABEL = '<p class="card-label">🇩🇪 German with Gender Colors</p>'
+_EN_LABEL = '<p class="card-label">🇬🇧 English Translation</p>'
+_ES_LABEL = '<p class="card-label">🇪🇸 Spanish Translation</p>'
+
+# Cards shown before any text is entered
+_EMPTY_PREVIEW_CARD = '<div class="card" style="height: 250px;"><div class="card-placeholder">Your formatted text will appear here...</div></div>'
+_EMPTY_GERMAN_CARD = '<div class="card" style="height: 400px;"><div class="card-placeholder">Enter text to the left to see gender-colored output</div></div>'
+_EMPTY_TRANSLATION_CARD = '<div class="card" style="height: 400px;"><div class="card-placeholder">Translation will appear here...</div></div>'
+
+# Example sentences offered in the sidebar
+_EXAMPLES = (
+    "Der Hund spielt mit der Katze.",
+    "Die Frau liest das Buch.",
+    "Das Kind isst einen Apfel.",
+    "Die Kinder spielen im Garten.",
+)
+
+# Longer dialogs show this many lines and fold the rest into a <details> block
+FOLD_AFTER_LINES = 200
+
+# Sidebar color legend box; the legend and palette are static
+_LEGEND_ITEM_TMPL = f'<div style="display: flex; align-items: center; gap: 10px; padding: 6px 0;"><span style="width: 14px; height: 14px; background: {{color}}; border-radius: 50%; display: inline-block; flex-shrink: 0;"></span><span style="color: {COLORS["sage_light"]}; font-size: 14px;">{{label}}</span></div>'
+_LEGEND_ITEMS = "".join(
+    _LEGEND_ITEM_TMPL.format(color=color, label=label)
+    for label, color in get_color_legend().items()
+)
+_LEGEND_HTML = f'<div style="background: {COLORS["purple_dark"]}; border: 2px solid {COLORS["purple_muted"]}; border-radius: 8px; padding: 20px; margin-bottom: 20px;"><h3 style="color: {COLORS["sage_light"]}; margin: 0 0 15px 0; font-size: 16px; font-weight: 600;">🎨 Color Legend</h3>{_LEGEND_ITEMS}</div>'
+
+# A rerun allocates many short-lived strings. The cyclic GC is shared by all
+# sessions and the server, so rather than pausing it, young collections are
+# made rarer, and the objects created at import (spaCy, Streamlit, these
+# constants) move to the permanent generation so collections skip them
+GC_GEN0_THRESHOLD = 10_000
+_gen0, _gen1, _gen2 = gc.get_threshold()
+gc.set_threshold(max(_gen0, GC_GEN0_THRESHOLD), _gen1, _gen2)
+gc.freeze()
+
+
+class _TranslationFailed(Exception):
+    """Raised inside the cached translation so that failures aren't cached."""
+
 
-def extract_speakers(text: str) -> dict:
+@st.cache_data(ttl=24 * 60 * 60, max_entries=128, show_spinner=False)
+def _cached_translation(text: str, target_lang: str) -> str:
+    """Translate German text, cached across reruns and sessions."""
+    # Imported on first use so the page can render before deep-translator loads
+    from src.translator import ERROR_PREFIX, translate_german
+    
+    translation = translate_german(text, target_lang)
+    if translation.startswith(ERROR_PREFIX):
+        raise _TranslationFailed(translation)
+    return translation
+
+
+def translate_cached(text: str, target_lang: str) -> str:
     """
-    Extract all speaker names from text and assign consistent colors.
+    Translate German text, serving repeated inputs from the Streamlit cache.
     
     Args:
-        text: The text to parse for speaker names
+        text: The German text to translate
+        target_lang: Target language code ('en' or 'es')
         
     Returns:
-        Dictionary mapping speaker names to their assigned colors
+        Translation or error message (error messages are not cached)
+    """
+    try:
+        return _cached_translation(text, target_lang)
+    except _TranslationFailed as e:
+        return str(e)
+
+
+def _join_folded(html_lines: List[str]) -> str:
     """
-    import re
+    Join formatted dialog lines, folding everything after the first
+    FOLD_AFTER_LINES lines into a collapsed <details> block, so the browser
+    only lays out the rest when it is expanded.
     
+    Args:
+        html_lines: HTML for each line of the text
+        
+    Returns:
+        HTML string
+    """
+    if len(html_lines) <= FOLD_AFTER_LINES:
+        return "".join(html_lines)
+    
+    visible = "".join(html_lines[:FOLD_AFTER_LINES])
+    rest = "".join(html_lines[FOLD_AFTER_LINES:])
+    return (
+        f'{visible}<details><summary style="cursor: pointer;">'
+        f'Show all {len(html_lines)} lines</summary>{rest}</details>'
+    )
+
+
+@st.cache_data(max_entries=64, ttl=10 * 60, show_spinner=False)
+def analyze_and_format(text: str) -> tuple:
+    """
+    Extract all speaker names from text, assign consistent colors, and
+    format the text as dialog HTML, in a single pass over the lines.
+    
+    Args:
+        text: The text to parse for speaker names
+        
+    Returns:
+        Tuple of (speaker-to-color mapping, HTML string)
+    """
     if not text or not text.strip():
-        return {}
+        return {}, ""
     
     speaker_color_map = {}
     color_index = 0
+    html_lines = []
     
     for line in text.split('\n'):
-        speaker_match = re.match(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*', line)
+        if not line.strip():
+            html_lines.append('<br>')
+            continue
+        
+        # Check if line starts with a speaker name; lines without a colon
+        # can't, so skip the regex for them
+        speaker_match = _SPEAKER_RE.match(line) if ':' in line else None
+        
         if speaker_match:
             speaker = speaker_match.group(1).strip()
+            rest_of_line = html.escape(line[speaker_match.end():], quote=False)
+            
+            # Assign the next color to speakers seen for the first time
             if speaker not in speaker_color_map:
                 speaker_color_map[speaker] = SPEAKER_COLORS[color_index % len(SPEAKER_COLORS)]
                 color_index += 1
+            
+            html_lines.append(
+                f'<div style="margin-bottom: 12px;"><strong style="color: {speaker_color_map[speaker]};">{speaker}:</strong> {rest_of_line}</div>'
+            )
+        else:
+            html_lines.append(f'<div style="margin-bottom: 12px;">{html.escape(line, quote=False)}</div>')
     
-    return speaker_color_map
+    return speaker_color_map, _join_folded(html_lines)
 
 
 def format_translation_html(text: str, speaker_color_map: dict = None) -> str:
@@ -70,43 +187,194 @@ def format_translation_html(text: str, speaker_color_map: dict = None) -> str:
         speaker_color_map: Optional pre-defined speaker-to-color mapping for consistency
         
     Returns:
-        HTML string with proper formatting
+        HTML string with proper formatting; line text is HTML-escaped
     """
-    import re
-    
-    if not text or not text.strip():
+    if not text:
         return ""
     
-    lines = text.split('\n')
     html_lines = []
     
     # Use provided map or create new one
     if speaker_color_map is None:
         speaker_color_map = {}
-        color_index = 0
     
-    for line in lines:
+    # Speakers that only appear in the translation (e.g. translated names)
+    # fall back to the default text color; bind both lookups once
+    color_for = speaker_color_map.get
+    default_color = COLORS["sage_light"]
+    
+    for line in text.split('\n'):
         if not line.strip():
             html_lines.append('<br>')
             continue
         
-        # Check if line starts with a speaker name (e.g., "Michael:", "Hr. Schmidt:")
-        speaker_match = re.match(r'^([A-Za-zÄÖÜäöüß\.\s]+):\s*', line)
+        # Check if line starts with a speaker name; lines without a colon
+        # can't, so skip the regex for them
+        speaker_match = _SPEAKER_RE.match(line) if ':' in line else None
         
         if speaker_match:
             speaker = speaker_match.group(1).strip()
-            rest_of_line = line[speaker_match.end():]
+            rest_of_line = html.escape(line[speaker_match.end():], quote=False)
             
-            # Get color from map or assign default
-            speaker_color = speaker_color_map.get(speaker, COLORS["sage_light"])
+            speaker_color = color_for(speaker, default_color)
             
             html_lines.append(
                 f'<div style="margin-bottom: 12px;"><strong style="color: {speaker_color};">{speaker}:</strong> {rest_of_line}</div>'
             )
         else:
-            html_lines.append(f'<div style="margin-bottom: 12px;">{line}</div>')
+            html_lines.append(f'<div style="margin-bottom: 12px;">{html.escape(line, quote=False)}</div>')
+    
+    return _join_folded(html_lines)
+
+
+@st.cache_data(max_entries=64, ttl=10 * 60, show_spinner=False)
+def _cached_colorize(text: str, speakers: tuple) -> str:
+    """
+    Gender-colorize German text, cached across reruns.
+    speakers is the speaker color map as a tuple of (name, color) items.
+    """
+    return colorize_text_html(text, dict(speakers))
+
+
+@st.cache_data(max_entries=64, ttl=10 * 60, show_spinner=False)
+def _cached_format(text: str, speakers: tuple) -> str:
+    """
+    Format text as dialog HTML, cached across reruns.
+    speakers is the speaker color map as a tuple of (name, color) items.
+    """
+    return format_translation_html(text, dict(speakers))
+
+
+def get_analysis(german_text: str) -> tuple:
+    """
+    Analyze German text for the input preview and gender colors panels,
+    reusing the last result from the session when the text hasn't changed.
+    
+    Args:
+        german_text: The German text to analyze
+        
+    Returns:
+        Tuple of (speaker colors as (name, color) items, preview HTML,
+        gender-colorized HTML)
+    """
+    state = st.session_state
+    last = state.get("_last_analysis")
+    if last is not None and last[0] == german_text:
+        return last[1:]
+    
+    # Extract speaker colors from German text for consistent coloring across
+    # all panels, formatting the input preview in the same pass
+    speaker_color_map, input_preview_html = analyze_and_format(german_text)
+    # Hashable form of the map for the cached HTML builders
+    speakers = tuple(speaker_color_map.items())
+    colorized_html = _cached_colorize(german_text, speakers)
+    
+    state["_last_analysis"] = (german_text, speakers, input_preview_html, colorized_html)
+    return speakers, input_preview_html, colorized_html
+
+
+def start_translations(german_text: str) -> tuple:
+    """
+    Start translating German text to English and Spanish in the background,
+    unless the session already has the translations for this text (e.g.
+    after a sidebar click).
+    
+    Args:
+        german_text: The German text to translate
+        
+    Returns:
+        Tuple of (English future, Spanish future), or None if the last
+        translations from the session can be reused
+    """
+    if st.session_state.get("_last_de") == german_text:
+        return None
+    
+    # A pool per run, so one session's translations never queue behind
+    # another's; shutting it down right away lets the threads exit once the
+    # two translations are done
+    pool = ThreadPoolExecutor(max_workers=2)
+    pending = (
+        pool.submit(translate_cached, german_text, "en"),
+        pool.submit(translate_cached, german_text, "es"),
+    )
+    pool.shutdown(wait=False)
+    return pending
+
+
+def get_translations(german_text: str, pending: tuple) -> tuple:
+    """
+    Wait for the translations started by start_translations.
+    
+    Args:
+        german_text: The German text being translated
+        pending: The value returned by start_translations
+        
+    Returns:
+        Tuple of (English translation, Spanish translation)
+    """
+    state = st.session_state
+    if pending is None:
+        return state["_last_en"], state["_last_es"]
+    
+    english_future, spanish_future = pending
+    english_text = english_future.result()
+    spanish_text = spanish_future.result()
+    
+    # Only remember successful translations so that failures are retried
+    from src.translator import ERROR_PREFIX
+    if not english_text.startswith(ERROR_PREFIX) and not spanish_text.startswith(ERROR_PREFIX):
+        state["_last_de"] = german_text
+        state["_last_en"] = english_text
+        state["_last_es"] = spanish_text
+    
+    return english_text, spanish_text
+
+
+def _render_translation_card(label_html: str, translation: str, speakers: tuple):
+    """
+    Render a translation column: its label and the card with the translation.
     
-    return "".join(html_lines)
+    Args:
+        label_html: Prebuilt column label (_EN_LABEL or _ES_LABEL)
+        translation: The translated text
+        speakers: Speaker color map as a tuple of (name, color) items
+    """
+    st.html(label_html + _CARD_OPEN + _cached_format(translation, speakers) + _CARD_CLOSE)
+
+
+def _render_empty_state(col_input, col_german):
+    """
+    Render the placeholder cards shown while there is no text to process.
+    
+    Args:
+        col_input: The input column, below the text area
+        col_german: The gender colors column
+    """
+    with col_input:
+        st.html(_PREVIEW_LABEL + _EMPTY_PREVIEW_CARD)
+    
+    with col_german:
+        st.html(_GERMAN_LABEL + _EMPTY_GERMAN_CARD)
+    
+    col_eng, col_esp = st.columns([1, 1], gap="medium")
+    
+    with col_eng:
+        st.html(_EN_LABEL + _EMPTY_TRANSLATION_CARD)
+    
+    with col_esp:
+        st.html(_ES_LABEL + _EMPTY_TRANSLATION_CARD)
+
+
+def _set_example(example: str):
+    """
+    Button callback that loads an example into the input text area.
+    Callbacks run before the script reruns, so the example shows up in
+    that run without an extra st.rerun().
+    
+    Args:
+        example: The example sentence
+    """
+    st.session_state.german_input = example
 
 
 def render_sidebar():
@@ -114,35 +382,17 @@ def render_sidebar():
     # ─────────────────────────────────────────
     # COLOR LEGEND BOX
     # ─────────────────────────────────────────
-    legend = get_color_legend()
-    legend_items = ""
-    for label, color in legend.items():
-        legend_items += f'<div style="display: flex; align-items: center; gap: 10px; padding: 6px 0;"><span style="width: 14px; height: 14px; background: {color}; border-radius: 50%; display: inline-block; flex-shrink: 0;"></span><span style="color: {COLORS["sage_light"]}; font-size: 14px;">{label}</span></div>'
-    
-    st.sidebar.markdown(
-        f'<div style="background: {COLORS["purple_dark"]}; border: 2px solid {COLORS["purple_muted"]}; border-radius: 8px; padding: 20px; margin-bottom: 20px;"><h3 style="color: {COLORS["sage_light"]}; margin: 0 0 15px 0; font-size: 16px; font-weight: 600;">🎨 Color Legend</h3>{legend_items}</div>',
-        unsafe_allow_html=True
-    )
+    st.sidebar.html(_LEGEND_HTML)
     
     # ─────────────────────────────────────────
     # EXAMPLES BOX
     # ─────────────────────────────────────────
-    st.sidebar.markdown(
-        f'<h3 style="color: {COLORS["sage_light"]}; margin: 0 0 10px 0; font-size: 16px; font-weight: 600;">📝 Examples</h3>',
-        unsafe_allow_html=True
+    st.sidebar.html(
+        f'<h3 style="color: {COLORS["sage_light"]}; margin: 0 0 10px 0; font-size: 16px; font-weight: 600;">📝 Examples</h3>'
     )
     
-    examples = [
-        "Der Hund spielt mit der Katze.",
-        "Die Frau liest das Buch.",
-        "Das Kind isst einen Apfel.",
-        "Die Kinder spielen im Garten.",
-    ]
-    
-    for example in examples:
-        if st.sidebar.button(example, key=example):
-            st.session_state.example_text = example
-            st.rerun()
+    for example in _EXAMPLES:
+        st.sidebar.button(example, key=example, on_click=_set_example, args=(example,))
 
 
 def main():
@@ -155,144 +405,13 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Custom CSS
-    st.markdown(
-        f"""
-        <style>
-        /* Main app background */
-        .stApp {{
-            background-color: {COLORS["black"]};
-        }}
-        
-        /* Main content padding */
-        .main .block-container {{
-            padding: 20px 30px;
-            max-width: 1400px;
-        }}
-        
-        /* Sidebar styling */
-        [data-testid="stSidebar"] {{
-            background-color: {COLORS["purple_darker"]};
-            border-right: 2px solid {COLORS["purple_muted"]};
-        }}
-        
-        [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] p {{
-            color: {COLORS["sage_light"]};
-        }}
-        
-        /* Text area styling */
-        .stTextArea textarea {{
-            font-size: 16px;
-            background-color: {COLORS["purple_dark"]} !important;
-            color: {COLORS["sage_light"]} !important;
-            border: 2px solid {COLORS["purple_muted"]};
-            border-radius: 8px;
-            -webkit-text-fill-color: {COLORS["sage_light"]} !important;
-            opacity: 1 !important;
-        }}
-        
-        .stTextArea textarea:focus {{
-            border-color: {COLORS["sage_light"]};
-            box-shadow: none;
-        }}
-        
-        .stTextArea textarea::placeholder {{
-            color: {COLORS["gray_medium"]} !important;
-            -webkit-text-fill-color: {COLORS["gray_medium"]} !important;
-        }}
-        
-        /* Disabled text area - ensure text is visible */
-        .stTextArea textarea:disabled {{
-            background-color: {COLORS["purple_dark"]} !important;
-            color: {COLORS["sage_light"]} !important;
-            -webkit-text-fill-color: {COLORS["sage_light"]} !important;
-            opacity: 1 !important;
-        }}
-        
-        /* Text area labels */
-        .stTextArea label {{
-            color: {COLORS["sage_light"]} !important;
-            font-size: 14px !important;
-            font-weight: 600 !important;
-        }}
-        
-        /* Fix label color for all text inputs */
-        .stTextArea label p {{
-            color: {COLORS["sage_light"]} !important;
-        }}
-        
-        /* Sidebar buttons */
-        [data-testid="stSidebar"] .stButton button {{
-            background-color: {COLORS["purple_darker"]};
-            color: {COLORS["sage_light"]};
-            border: 1px solid {COLORS["purple_muted"]};
-            font-size: 12px;
-            padding: 8px 12px;
-            text-align: left;
-            width: 100%;
-            margin-bottom: 5px;
-            border-radius: 6px;
-        }}
-        
-        [data-testid="stSidebar"] .stButton button:hover {{
-            background-color: {COLORS["purple_muted"]};
-            border-color: {COLORS["sage_light"]};
-        }}
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {{visibility: hidden;}}
-        footer {{visibility: hidden;}}
-        header {{visibility: hidden;}}
-        
-        /* Card styling */
-        .card {{
-            background: {COLORS["purple_dark"]};
-            border: 2px solid {COLORS["purple_muted"]};
-            border-radius: 8px;
-            padding: 20px;
-            height: 100%;
-        }}
-        
-        .card-title {{
-            color: {COLORS["sage_light"]};
-            font-size: 14px;
-            font-weight: 600;
-            margin-bottom: 15px;
-            letter-spacing: 0.5px;
-        }}
-        
-        .card-content {{
-            color: {COLORS["sage_light"]};
-            font-size: 16px;
-            line-height: 1.9;
-            font-family: 'Georgia', 'Times New Roman', serif;
-        }}
-        
-        /* Dialog styling - speaker names */
-        .card-content strong {{
-            color: {COLORS["sage_light"]};
-            font-weight: 700;
-        }}
-        
-        /* Dialog paragraphs */
-        .card-content div {{
-            margin-bottom: 10px;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+    # Custom CSS. It has to be sent on every run: Streamlit drops elements
+    # that a rerun doesn't emit again, which would unstyle the page
+    st.html(CSS_BLOB)
     
     # Render sidebar
     render_sidebar()
     
-    # Get example text if clicked
-    if "example_text" in st.session_state:
-        default_text = st.session_state.example_text
-        del st.session_state.example_text
-    else:
-        default_text = ""
-    
     # ═══════════════════════════════════════════════════════════════
     # MAIN CONTENT - GRID LAYOUT
     # ═══════════════════════════════════════════════════════════════
@@ -303,131 +422,55 @@ def main():
     col_input, col_german = st.columns([1, 1], gap="medium")
     
     with col_input:
-        german_text = st.text_area(
-            label="✍️ Enter German Text (supports dialogs with multiple speakers)",
-            value=default_text,
-            placeholder="Paste your German dialog here...\n\nExample:\nMichael: Guten Tag, wie geht es Ihnen?\nHr. Schmidt: Mir geht es gut, danke!",
-            height=120,
-        )
-        
-        # Extract speaker colors from German text for consistent coloring across all panels
-        speaker_color_map = extract_speakers(german_text) if german_text else {}
-        
-        # Show formatted preview with colored speaker names below input
-        st.markdown(
-            f'<p style="color: {COLORS["sage_light"]}; font-size: 14px; font-weight: 600; margin-top: 10px; margin-bottom: 5px;">📝 Input Preview</p>',
-            unsafe_allow_html=True
-        )
-        if german_text:
-            input_preview_html = format_translation_html(german_text, speaker_color_map)
-            st.markdown(
-                f'''
-                <div class="card" style="height: 250px; overflow-y: auto;">
-                    <div class="card-content">{input_preview_html}</div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
-        else:
-            st.markdown(
-                f'''
-                <div class="card" style="height: 250px;">
-                    <div style="color: {COLORS["gray_medium"]}; font-size: 14px;">
-                        Your formatted text will appear here...
-                    </div>
-                </div>
-                ''',
-                unsafe_allow_html=True
+        # The text only reaches the script when the form is submitted (button
+        # or Ctrl+Enter), so edits in progress don't trigger any work
+        with st.form("translate_form", border=False):
+            german_text = st.text_area(
+                label="✍️ Enter German Text (supports dialogs with multiple speakers)",
+                key="german_input",
+                placeholder="Paste your German dialog here...\n\nExample:\nMichael: Guten Tag, wie geht es Ihnen?\nHr. Schmidt: Mir geht es gut, danke!",
+                height=120,
             )
+            st.form_submit_button("Translate")
+        # Whitespace-only input is treated like an empty text area
+        has_text = bool(german_text and german_text.strip())
+    
+    # Load the translator in the background while the first text is typed
+    if "src.translator" not in sys.modules:
+        threading.Thread(target=importlib.import_module, args=("src.translator",), daemon=True).start()
+    
+    # Nothing to analyze or translate: show the placeholder cards and stop
+    if not has_text:
+        _render_empty_state(col_input, col_german)
+        return
+    
+    # The translations are network-bound: start them first so they are in
+    # flight while spaCy analyzes the text and the German panels render
+    pending_translations = start_translations(german_text)
+    
+    speakers, input_preview_html, colorized_html = get_analysis(german_text)
+    
+    with col_input:
+        # Show formatted preview with colored speaker names below input,
+        # label and card in a single element
+        st.html(_PREVIEW_LABEL + _PREVIEW_CARD_OPEN + input_preview_html + _CARD_CLOSE)
     
     with col_german:
-        st.markdown(
-            f'<p style="color: {COLORS["sage_light"]}; font-size: 14px; font-weight: 600; margin-bottom: 5px;">🇩🇪 German with Gender Colors</p>',
-            unsafe_allow_html=True
-        )
-        if german_text:
-            colorized_html = colorize_text_html(german_text, speaker_color_map)
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px; overflow-y: auto;">
-                    <div class="card-content">{colorized_html}</div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
-        else:
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px;">
-                    <div style="color: {COLORS["gray_medium"]}; font-size: 14px;">
-                        Enter text to the left to see gender-colored output
-                    </div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
+        st.html(_GERMAN_LABEL + _CARD_OPEN + colorized_html + _CARD_CLOSE)
     
     # ─────────────────────────────────────────
     # ROW 2: TRANSLATIONS (English | Spanish)
     # ─────────────────────────────────────────
     
+    english_text, spanish_text = get_translations(german_text, pending_translations)
+    
     col_eng, col_esp = st.columns([1, 1], gap="medium")
     
     with col_eng:
-        st.markdown(
-            f'<p style="color: {COLORS["sage_light"]}; font-size: 14px; font-weight: 600; margin-bottom: 5px;">🇬🇧 English Translation</p>',
-            unsafe_allow_html=True
-        )
-        if german_text:
-            english_text = translate_to_english(german_text)
-            english_html = format_translation_html(english_text, speaker_color_map)
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px; overflow-y: auto;">
-                    <div class="card-content">{english_html}</div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
-        else:
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px;">
-                    <div style="color: {COLORS["gray_medium"]}; font-size: 14px;">
-                        Translation will appear here...
-                    </div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
+        _render_translation_card(_EN_LABEL, english_text, speakers)
     
     with col_esp:
-        st.markdown(
-            f'<p style="color: {COLORS["sage_light"]}; font-size: 14px; font-weight: 600; margin-bottom: 5px;">🇪🇸 Spanish Translation</p>',
-            unsafe_allow_html=True
-        )
-        if german_text:
-            spanish_text = translate_to_spanish(german_text)
-            spanish_html = format_translation_html(spanish_text, speaker_color_map)
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px; overflow-y: auto;">
-                    <div class="card-content">{spanish_html}</div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
-        else:
-            st.markdown(
-                f'''
-                <div class="card" style="height: 400px;">
-                    <div style="color: {COLORS["gray_medium"]}; font-size: 14px;">
-                        Translation will appear here...
-                    </div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
+        _render_translation_card(_ES_LABEL, spanish_text, speakers)
 
 
 if __name__ == "__main__":